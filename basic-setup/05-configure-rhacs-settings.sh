@@ -50,28 +50,12 @@ ROX_CENTRAL_ADDRESS="${ROX_CENTRAL_ADDRESS:-}"
 RHACS_BASE_IMAGE_REPO_PATH="${RHACS_BASE_IMAGE_REPO_PATH:-registry.access.redhat.com/hi/python}"
 RHACS_BASE_IMAGE_TAG_PATTERN="${RHACS_BASE_IMAGE_TAG_PATTERN:-3.13}"
 SKIP_RHACS_BASE_IMAGES="${SKIP_RHACS_BASE_IMAGES:-0}"
-# Function to check if jq is installed
+# Function to check that jq is installed (a README prerequisite; no runtime package install)
 ensure_jq() {
-    if command -v jq >/dev/null 2>&1; then
-        return 0
-    fi
-    
-    print_warn "jq is not installed, attempting to install..."
-    
-    if command -v dnf >/dev/null 2>&1; then
-        if sudo dnf install -y jq >/dev/null 2>&1; then
-            print_info "✓ jq installed successfully"
-            return 0
-        fi
-    elif command -v apt-get >/dev/null 2>&1; then
-        if sudo apt-get update >/dev/null 2>&1 && sudo apt-get install -y jq >/dev/null 2>&1; then
-            print_info "✓ jq installed successfully"
-            return 0
-        fi
-    fi
-    
-    print_error "Could not install jq. Please install it manually: sudo dnf install -y jq"
-    return 1
+    command -v jq >/dev/null 2>&1 || {
+        print_error "jq is required. Install with: sudo dnf install -y jq"
+        return 1
+    }
 }
 
 # Function to get Central URL
@@ -99,16 +83,16 @@ make_api_call() {
     local api_base=$4
     local data="${5:-}"
     
-    local curl_opts="-k -s -w \n%{http_code}"
-    curl_opts="${curl_opts} -X ${method}"
-    curl_opts="${curl_opts} -H \"Authorization: Bearer ${token}\""
-    curl_opts="${curl_opts} -H \"Content-Type: application/json\""
+    # Pass arguments as an array so curl gets them verbatim (no eval / re-quoting of token or payload)
+    local curl_opts=(-k -s -w "\n%{http_code}" -X "${method}"
+        -H "Authorization: Bearer ${token}"
+        -H "Content-Type: application/json")
     
     if [ -n "${data}" ]; then
-        curl_opts="${curl_opts} -d '${data}'"
+        curl_opts+=(-d "${data}")
     fi
     
-    local response=$(eval "curl ${curl_opts} \"${api_base}/${endpoint}\"" 2>/dev/null || echo "")
+    local response=$(curl "${curl_opts[@]}" "${api_base}/${endpoint}" 2>/dev/null || echo "")
     
     local http_code=$(echo "${response}" | tail -n1)
     local body=$(echo "${response}" | sed '$d')
@@ -37,28 +37,12 @@ COMPLIANCE_NAMESPACE="${COMPLIANCE_NAMESPACE:-openshift-compliance}"
 ROX_CENTRAL_ADDRESS="${ROX_CENTRAL_ADDRESS:-}"
 SCAN_NAME="acs-catch-all"
 
-# Function to ensure jq is installed
+# Function to check that jq is installed (a README prerequisite; no runtime package install)
 ensure_jq() {
-    if command -v jq >/dev/null 2>&1; then
-        return 0
-    fi
-    
-    print_warn "jq is not installed, attempting to install..."
-    
-    if command -v dnf >/dev/null 2>&1; then
-        if sudo dnf install -y jq >/dev/null 2>&1; then
-            print_info "✓ jq installed successfully"
-            return 0
-        fi
-    elif command -v apt-get >/dev/null 2>&1; then
-        if sudo apt-get update >/dev/null 2>&1 && sudo apt-get install -y jq >/dev/null 2>&1; then
-            print_info "✓ jq installed successfully"
-            return 0
-        fi
-    fi
-    
-    print_error "Could not install jq. Please install it manually"
-    return 1
+    command -v jq >/dev/null 2>&1 || {
+        print_error "jq is required. Install with: sudo dnf install -y jq"
+        return 1
+    }
 }
 
 # Function to get Central URL
@@ -179,11 +163,11 @@ wait_for_compliance_pods() {
     return 0
 }
 
-# Function to check if scan configuration exists
-scan_config_exists() {
+# Function to fetch compliance scan configurations (outputs the response body)
+# Fetched once in main() and shared by the exists/delete checks below.
+get_scan_configs() {
     local token=$1
     local api_base=$2
-    local scan_name=$3
     
     local response=$(curl -k -s -w "\n%{http_code}" --connect-timeout 15 --max-time 60 \
         -X GET \
@@ -198,7 +182,24 @@ scan_config_exists() {
         return 1
     fi
     
-    local scan_id=$(echo "${body}" | jq -r ".configurations[] | select(.scanName == \"${scan_name}\") | .id" 2>/dev/null || echo "")
+    echo "${body}"
+    return 0
+}
+
+# Function to look up a scan configuration ID by name in a get_scan_configs body
+get_scan_config_id() {
+    local configs_body=$1
+    local scan_name=$2
+    
+    echo "${configs_body}" | jq -r --arg n "${scan_name}" '.configurations[]? | select(.scanName == $n) | .id' 2>/dev/null | head -1 || echo ""
+}
+
+# Function to check if scan configuration exists
+scan_config_exists() {
+    local configs_body=$1
+    local scan_name=$2
+    
+    local scan_id=$(get_scan_config_id "${configs_body}" "${scan_name}")
     
     if [ -n "${scan_id}" ] && [ "${scan_id}" != "null" ]; then
         return 0
@@ -212,23 +213,15 @@ delete_scan_config() {
     local token=$1
     local api_base=$2
     local scan_name=$3
+    local configs_body="${4:-}"
     
     print_info "Checking for existing scan configuration..."
     
-    local response=$(curl -k -s -w "\n%{http_code}" --connect-timeout 15 --max-time 60 \
-        -X GET \
-        -H "Authorization: Bearer ${token}" \
-        -H "Content-Type: application/json" \
-        "${api_base}/v2/compliance/scan/configurations" 2>/dev/null || echo "")
-    
-    local http_code=$(echo "${response}" | tail -n1)
-    local body=$(echo "${response}" | sed '$d')
-    
-    if [ "${http_code}" != "200" ]; then
+    if [ -z "${configs_body}" ]; then
         return 0
     fi
     
-    local scan_id=$(echo "${body}" | jq -r ".configurations[] | select(.scanName == \"${scan_name}\") | .id" 2>/dev/null || echo "")
+    local scan_id=$(get_scan_config_id "${configs_body}" "${scan_name}")
     
     if [ -z "${scan_id}" ] || [ "${scan_id}" = "null" ]; then
         print_info "No existing scan configuration found"
@@ -260,8 +253,8 @@ get_tailored_profile_names() {
     if ! oc get crd tailoredprofiles.compliance.openshift.io &>/dev/null 2>&1; then
         return 0
     fi
-    oc get tailoredprofile -n "${COMPLIANCE_NAMESPACE}" -o json 2>/dev/null | \
-        jq -r '.items[]? | select(.metadata.name != null) | .metadata.name' 2>/dev/null || true
+    oc get tailoredprofile -n "${COMPLIANCE_NAMESPACE}" \
+        -o jsonpath='{range .items[*]}{.metadata.name}{"\n"}{end}' 2>/dev/null || true
 }
 
 # Function to create scan configuration
@@ -294,9 +287,9 @@ create_scan_config() {
     local profiles_json
     profiles_json=$(printf '%s\n' "${stock_profiles[@]}" "${tailored[@]}" | jq -R . | jq -s .)
     
-    # Create JSON payload in a temp file for reliable transmission
-    local temp_file=$(mktemp)
-    jq -n \
+    # Build the JSON payload in memory and stream it to curl on stdin (no temp file round-trip)
+    local payload
+    if ! payload=$(jq -n \
         --arg scanName "${scan_name}" \
         --arg clusterId "${cluster_id}" \
         --argjson profiles "${profiles_json}" \
@@ -309,27 +302,20 @@ create_scan_config() {
             description: "Daily compliance scan (stock + tailored profiles)"
           },
           clusters: [$clusterId]
-        }' > "${temp_file}"
-    
-    # Debug: verify JSON is valid
-    if ! jq . "${temp_file}" >/dev/null 2>&1; then
+        }' 2>/dev/null); then
         print_error "Generated invalid JSON payload"
-        rm -f "${temp_file}"
         return 1
     fi
     
     print_info "Making API request to: ${api_base}/v2/compliance/scan/configurations"
     
-    local response=$(curl -k -s -w "\n%{http_code}" --connect-timeout 15 --max-time 60 \
+    local response=$(printf '%s' "${payload}" | curl -k -s -w "\n%{http_code}" --connect-timeout 15 --max-time 60 \
         -X POST \
         -H "Authorization: Bearer ${token}" \
         -H "Content-Type: application/json" \
-        --data @"${temp_file}" \
+        --data-binary @- \
         "${api_base}/v2/compliance/scan/configurations" 2>&1)
     
-    # Clean up temp file
-    rm -f "${temp_file}"
-    
     local http_code=$(echo "${response}" | tail -n1)
     local body=$(echo "${response}" | sed '$d')
     
@@ -359,23 +345,24 @@ create_scan_config() {
     
     print_info "✓ Scan configuration created successfully"
     
-    # Wait and verify
-    sleep 2
-    
-    local verify_response=$(curl -k -s -w "\n%{http_code}" --connect-timeout 15 --max-time 60 \
-        -X GET \
-        -H "Authorization: Bearer ${token}" \
-        -H "Content-Type: application/json" \
-        "${api_base}/v2/compliance/scan/configurations" 2>/dev/null || echo "")
-    
-    local verify_code=$(echo "${verify_response}" | tail -n1)
-    local verify_body=$(echo "${verify_response}" | sed '$d')
-    
-    if [ "${verify_code}" = "200" ]; then
-        local verify_id=$(echo "${verify_body}" | jq -r ".configurations[] | select(.scanName == \"${scan_name}\") | .id" 2>/dev/null || echo "")
-        if [ -n "${verify_id}" ] && [ "${verify_id}" != "null" ]; then
-            print_info "✓ Scan configuration verified (ID: ${verify_id})"
+    # Verify, polling briefly only if the new configuration is not listed yet
+    local verify_body verify_id attempt verified=false
+    for attempt in 1 2 3 4 5; do
+        if verify_body=$(get_scan_configs "${token}" "${api_base}"); then
+            verify_id=$(get_scan_config_id "${verify_body}" "${scan_name}")
+            if [ -n "${verify_id}" ] && [ "${verify_id}" != "null" ]; then
+                print_info "✓ Scan configuration verified (ID: ${verify_id})"
+                verified=true
+                break
+            fi
         fi
+        if [ "${attempt}" -lt 5 ]; then
+            sleep 1
+        fi
+    done
+    
+    if [ "${verified}" = "false" ]; then
+        print_warn "Could not verify scan configuration '${scan_name}' yet - check RHACS UI → Compliance → Schedules"
     fi
     
     return 0
@@ -438,14 +425,16 @@ main() {
     
     # Check if already configured
     print_step "Checking for existing scan configuration..."
-    if scan_config_exists "${token}" "${api_base}" "${SCAN_NAME}"; then
+    local scan_configs=""
+    scan_configs=$(get_scan_configs "${token}" "${api_base}") || scan_configs=""
+    if scan_config_exists "${scan_configs}" "${SCAN_NAME}"; then
         print_info "✓ Scan configuration '${SCAN_NAME}' already exists"
         print_info "Skipping scan configuration setup"
     else
         print_info "Scan configuration not found, creating..."
         
         # Delete any existing config
-        delete_scan_config "${token}" "${api_base}" "${SCAN_NAME}" || true
+        delete_scan_config "${token}" "${api_base}" "${SCAN_NAME}" "${scan_configs}" || true
         
         # Create new config
         if ! create_scan_config "${token}" "${api_base}" "${cluster_id}" "${SCAN_NAME}"; then
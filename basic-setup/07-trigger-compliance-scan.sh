@@ -55,18 +55,13 @@ make_api_call() {
     local data="${3:-}"
     
     if [ -n "${data}" ]; then
-        # Use temp file for data to avoid quoting issues
-        local temp_file=$(mktemp)
-        printf "%s" "${data}" > "${temp_file}"
-        
-        local response=$(curl -k -s -w "\n%{http_code}" \
+        # Stream data on stdin to avoid quoting issues (no temp file write/read-back)
+        local response=$(printf "%s" "${data}" | curl -k -s -w "\n%{http_code}" \
             -X "${method}" \
             -H "Authorization: Bearer ${ROX_API_TOKEN}" \
             -H "Content-Type: application/json" \
-            --data-binary @"${temp_file}" \
+            --data-binary @- \
             "${endpoint}" 2>&1)
-        
-        rm -f "${temp_file}"
     else
         local response=$(curl -k -s -w "\n%{http_code}" \
             -X "${method}" \
@@ -109,28 +104,22 @@ get_cluster_id() {
         return 1
     fi
     
-    # Try to find "production" cluster first (lowercase to match your output)
-    local cluster_id=$(echo "${body}" | jq -r '.clusters[] | select(.name == "production") | .id' 2>/dev/null | head -1)
-    
-    # Try case-insensitive
-    if [ -z "${cluster_id}" ] || [ "${cluster_id}" = "null" ]; then
-        cluster_id=$(echo "${body}" | jq -r '.clusters[] | select(.name | ascii_downcase == "production") | .id' 2>/dev/null | head -1)
-    fi
+    # Pick the cluster in a single jq pass: "production" (exact, then case-insensitive), else the first one.
+    # '|' is not IFS whitespace, so an empty name cannot shift fields; name goes last so it keeps any '|'.
+    local cluster_id="" cluster_name="" cluster_health=""
+    IFS='|' read -r cluster_id cluster_health cluster_name < <(echo "${body}" | jq -r '
+        (first(.clusters[]? | select(.name == "production"))
+         // first(.clusters[]? | select((.name // "") | ascii_downcase == "production"))
+         // .clusters[0]
+         // empty)
+        | [(.id // ""), (.healthStatus.overallHealthStatus // "UNKNOWN"), (.name // "")] | join("|")
+    ' 2>/dev/null) || true
     
-    # If not found, use first cluster
     if [ -z "${cluster_id}" ] || [ "${cluster_id}" = "null" ]; then
-        cluster_id=$(echo "${body}" | jq -r '.clusters[0].id // empty' 2>/dev/null)
-    fi
-    
-    if [ -z "${cluster_id}" ]; then
         print_error "No clusters found" >&2
         return 1
     fi
     
-    # Get cluster name and health for logging
-    local cluster_name=$(echo "${body}" | jq -r ".clusters[] | select(.id == \"${cluster_id}\") | .name" 2>/dev/null)
-    local cluster_health=$(echo "${body}" | jq -r ".clusters[] | select(.id == \"${cluster_id}\") | .healthStatus.overallHealthStatus // \"UNKNOWN\"" 2>/dev/null)
-    
     print_info "✓ Cluster: ${cluster_name} (ID: ${cluster_id}, Health: ${cluster_health})" >&2
     
     # Output ONLY the cluster ID to stdout
@@ -239,8 +228,6 @@ trigger_compliance_scans() {
             fi
             failed_count=$((failed_count + 1))
         fi
-        
-        sleep 1
     done
     
     echo ""
@@ -240,8 +240,11 @@ add_bashrc_vars_from_cluster() {
     touch ~/.bashrc
 
     if ! grep -qE "^(export[[:space:]]+)?ROX_CENTRAL_ADDRESS=" ~/.bashrc 2>/dev/null; then
-        local url
-        url=$(oc get route "${route}" -n "${ns}" -o jsonpath='https://{.spec.host}' 2>/dev/null) || true
+        # Persist an already-exported value as-is; only query the route when it is unknown
+        local url="${ROX_CENTRAL_ADDRESS:-}"
+        if [ -z "${url}" ]; then
+            url=$(oc get route "${route}" -n "${ns}" -o jsonpath='https://{.spec.host}' 2>/dev/null) || true
+        fi
         if [ -n "${url}" ]; then
             echo "export ROX_CENTRAL_ADDRESS=\"${url}\"" >> ~/.bashrc
             print_info "Added ROX_CENTRAL_ADDRESS to ~/.bashrc"
@@ -289,14 +292,18 @@ export_bashrc_vars() {
     local vars=(ROX_CENTRAL_ADDRESS ROX_PASSWORD RHACS_NAMESPACE RHACS_ROUTE_NAME KUBECONFIG GUID CLOUDUSER)
     [ ! -f ~/.bashrc ] && return 0
     
-    for var in "${vars[@]}"; do
-        local line
-        line=$(grep -E "^(export[[:space:]]+)?${var}=" ~/.bashrc 2>/dev/null | head -1)
-        if [ -n "$line" ]; then
-            [[ "$line" =~ ^export[[:space:]]+ ]] || line="export $line"
-            eval "$line" 2>/dev/null || true
-        fi
-    done
+    # Single grep over ~/.bashrc for all variables; the first assignment of each one wins
+    local pattern="^(export[[:space:]]+)?($(IFS='|'; echo "${vars[*]}"))="
+    local line var
+    local -A seen=()
+    while IFS= read -r line; do
+        [[ "$line" =~ ^(export[[:space:]]+)?([A-Za-z_][A-Za-z0-9_]*)= ]] || continue
+        var="${BASH_REMATCH[2]}"
+        [ -n "${seen[$var]:-}" ] && continue
+        seen[$var]=1
+        [[ "$line" =~ ^export[[:space:]]+ ]] || line="export $line"
+        eval "$line" 2>/dev/null || true
+    done < <(grep -E "${pattern}" ~/.bashrc 2>/dev/null || true)
 }
 
 # Generate API token using curl (outputs only token to stdout)
@@ -481,9 +488,11 @@ main() {
     # Add gRPC ALPN fix to ~/.bashrc (required for roxctl)
     print_info "Configuring gRPC ALPN fix for roxctl..."
     if [ -f ~/.bashrc ] && ! grep -q "GRPC_ENFORCE_ALPN_ENABLED" ~/.bashrc; then
-        echo "" >> ~/.bashrc
-        echo "# Fix for gRPC ALPN enforcement issues with roxctl (https://github.com/grpc/grpc-go/issues/7769)" >> ~/.bashrc
-        echo "export GRPC_ENFORCE_ALPN_ENABLED=false" >> ~/.bashrc
+        cat >> ~/.bashrc <<'EOF'
+
+# Fix for gRPC ALPN enforcement issues with roxctl (https://github.com/grpc/grpc-go/issues/7769)
+export GRPC_ENFORCE_ALPN_ENABLED=false
+EOF
         print_info "✓ Added GRPC_ENFORCE_ALPN_ENABLED=false to ~/.bashrc"
     else
         print_info "✓ GRPC_ENFORCE_ALPN_ENABLED already in ~/.bashrc"
@@ -658,11 +667,14 @@ main() {
         # Option 4: Try to extract from Central deployment logs (operator installations)
         if [ -z "${password}" ]; then
             print_info "Checking Central deployment logs for initial password..."
-            password=$(oc logs deployment/central -n "${ns}" --since=24h 2>/dev/null | grep -oP '(?<=password:\s).*' | head -1 || true)
+            # Read the (potentially large) log stream once and search it for both patterns
+            local central_logs
+            central_logs=$(oc logs deployment/central -n "${ns}" --since=24h 2>/dev/null || true)
+            password=$(printf '%s\n' "${central_logs}" | grep -oP '(?<=password:\s).*' | head -1 || true)
             
             # Alternative pattern for operator logs
             if [ -z "${password}" ]; then
-                password=$(oc logs deployment/central -n "${ns}" --since=24h 2>/dev/null | grep -i "admin.*password" | grep -oP '[A-Za-z0-9@#$%^&*()_+\-=\[\]{};:,.<>?]{16,}' | head -1 || true)
+                password=$(printf '%s\n' "${central_logs}" | grep -i "admin.*password" | grep -oP '[A-Za-z0-9@#$%^&*()_+\-=\[\]{};:,.<>?]{16,}' | head -1 || true)
             fi
         fi
         
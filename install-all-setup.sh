@@ -34,6 +34,8 @@
 #
 # Phase 2 progress (long waits / SSH): each job prints when it exits; every INSTALL_ALL_PARALLEL_PROGRESS_SEC
 # (default 45) a line lists jobs still running. Tune with INSTALL_ALL_PARALLEL_POLL_SEC (default 3).
+# INSTALL_ALL_FAIL_FAST=1 stops the remaining Phase 2 jobs as soon as one fails instead of waiting
+# for all of them to finish.
 #
 # Phase 1 (basic-setup) streams to your terminal and to .setup-parallel-logs/basic-setup.log so
 # long runs do not look hung over SSH; parallel phases still log only to per-job files until they finish.
@@ -298,6 +300,7 @@ main() {
         echo ""
     fi
 
+    local fail_fast="${INSTALL_ALL_FAIL_FAST:-0}"
     declare -a jobs_names=()
     declare -a jobs_pids=()
     declare -a jobs_logs=()
@@ -310,11 +313,19 @@ main() {
         local script="$2"
         shift 2
         local lg="${LOG_DIR}/${n}.log"
+        # With fail fast, monitor mode gives the job its own process group (pgid = pid) so it can be
+        # stopped together with whatever it is running (oc wait, helm --wait, polling subshells).
+        # Such jobs no longer see Ctrl-C from the terminal; interrupt_jobs below forwards it.
+        # stdin is /dev/null explicitly: monitor mode no longer redirects it for background jobs.
+        if [ "${fail_fast}" = "1" ]; then
+            set -m
+        fi
         (
             cd "${REPO_ROOT}"
             exec bash "${script}" "$@"
-        ) >"${lg}" 2>&1 &
+        ) >"${lg}" 2>&1 </dev/null &
         local pid=$!
+        set +m
         jobs_names+=("${n}")
         jobs_pids+=("${pid}")
         jobs_logs+=("${lg}")
@@ -322,6 +333,52 @@ main() {
         print_info "Started ${n} (pid ${pid}) → ${lg}"
     }
 
+    # TERM the job's process group, then KILL whatever is left after a short grace period so an
+    # installer that traps TERM cannot block the wait below forever.
+    stop_job_group() {
+        local _pid="$1" _t
+        kill -TERM -- -"${_pid}" 2>/dev/null || kill -TERM "${_pid}" 2>/dev/null || true
+        for _t in 1 2 3 4 5 6 7 8 9 10; do
+            kill -0 "${_pid}" 2>/dev/null || break
+            sleep 0.5
+        done
+        kill -KILL -- -"${_pid}" 2>/dev/null || kill -KILL "${_pid}" 2>/dev/null || true
+        wait "${_pid}" 2>/dev/null || true
+    }
+
+    # Fail fast: terminate each job still running (its whole process group) and count it as failed
+    # (its log is partial). Relies on main's locals job_done, completed and failed_parallel_scripts
+    # through dynamic scope, so only call it from the wait loop below.
+    stop_running_jobs() {
+        local _k
+        for _k in "${!jobs_pids[@]}"; do
+            if [ "${job_done[$_k]}" = "1" ]; then
+                continue
+            fi
+            stop_job_group "${jobs_pids[$_k]}"
+            job_done[$_k]=1
+            completed=$((completed + 1))
+            failed_parallel_scripts+=("${jobs_scripts[$_k]}")
+            print_warn "Stopped ${jobs_names[$_k]} (INSTALL_ALL_FAIL_FAST=1); partial log: ${jobs_logs[$_k]}"
+        done
+    }
+
+    # Fail-fast jobs run in their own process groups and miss the terminal's Ctrl-C, so forward
+    # INT / TERM to every job started so far before exiting.
+    interrupt_jobs() {
+        local _k
+        print_warn "Interrupted; stopping parallel jobs..."
+        for _k in "${!jobs_pids[@]}"; do
+            if [ "${job_done[$_k]:-0}" != "1" ]; then
+                stop_job_group "${jobs_pids[$_k]}"
+            fi
+        done
+        exit 130
+    }
+    if [ "${fail_fast}" = "1" ]; then
+        trap interrupt_jobs INT TERM
+    fi
+
     print_step "Phase 2: FAM, monitoring, MCP, OpenShift Pipelines, Splunk, custom-policies (parallel)"
     if [ "${SKIP_FAM_SETUP:-0}" != "1" ] && [ "${SKIP_FIM_SETUP:-0}" != "1" ]; then
         add_job fam-setup "${REPO_ROOT}/fam-setup/install.sh"
@@ -389,6 +446,10 @@ main() {
                     failed_parallel_scripts+=("${jobs_scripts[$_i]}")
                     print_error "✗ ${jobs_names[$_i]} failed (exit ${ec}); see ${jobs_logs[$_i]}"
                     print_info "To rerun this step: bash \"${jobs_scripts[$_i]}\""
+                    if [ "${fail_fast}" = "1" ]; then
+                        stop_running_jobs
+                        break
+                    fi
                 fi
             fi
         done
@@ -20,6 +20,8 @@ print_step() { echo -e "${BLUE}[STEP]${NC} $*"; }
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 MANIFESTS_DIR="${SCRIPT_DIR}/manifests"
 MCP_NAMESPACE="${MCP_NAMESPACE:-stackrox-mcp}"
+# Remember whether RHACS_NAMESPACE was exported before the default applies, so ~/.bashrc can still override the default
+RHACS_NAMESPACE_FROM_ENV="${RHACS_NAMESPACE:+1}"
 RHACS_NAMESPACE="${RHACS_NAMESPACE:-stackrox}"
 LIGHTSPEED_NAMESPACE="${LIGHTSPEED_NAMESPACE:-openshift-lightspeed}"
 LIGHTSPEED_OLSCONFIG_NAME="${LIGHTSPEED_OLSCONFIG_NAME:-cluster}"
@@ -65,6 +67,15 @@ mcp_subs_namespace() {
 export_bashrc_vars() {
     [ ! -f ~/.bashrc ] && return 0
     for var in ROX_CENTRAL_ADDRESS ROX_API_TOKEN RHACS_NAMESPACE; do
+        # Skip variables the caller exported. RHACS_NAMESPACE already holds the stackrox default
+        # here, so check whether it came from the environment instead.
+        if [ "${var}" = "RHACS_NAMESPACE" ]; then
+            if [ -n "${RHACS_NAMESPACE_FROM_ENV}" ]; then
+                continue
+            fi
+        elif [ -n "${!var:-}" ]; then
+            continue
+        fi
         local line
         # grep exits 1 when no match; with pipefail that would kill the script under set -e
         line=$(grep -E "^(export[[:space:]]+)?${var}=" ~/.bashrc 2>/dev/null | head -1) || true
@@ -58,6 +58,8 @@ load_rox_from_bashrc() {
     [ ! -f ~/.bashrc ] && return 0
     local var line
     for var in ROX_CENTRAL_ADDRESS ROX_API_TOKEN RHACS_NAMESPACE; do
+        # Keep what the caller exported; only read variables this shell does not have yet
+        [ -n "${!var:-}" ] && continue
         line=$(grep -E "^(export[[:space:]]+)?${var}=" ~/.bashrc 2>/dev/null | head -1) || true
         [ -z "$line" ] && continue
         if grep -qE '\$\(|`' <<< "$line"; then
@@ -186,7 +188,8 @@ echo "============================================"
 echo ""
 
 # Non-login shells do not source ~/.bashrc; sub-scripts do not export back to this shell.
-log "Loading ROX_CENTRAL_ADDRESS / ROX_API_TOKEN from ~/.bashrc before verification..."
+# Pick up values the sub-scripts saved to ~/.bashrc, but only for variables still unset here.
+log "Filling any unset ROX_CENTRAL_ADDRESS / ROX_API_TOKEN from ~/.bashrc before verification..."
 load_rox_from_bashrc
 if [ -n "${ROX_CENTRAL_ADDRESS:-}" ] && [ -n "${ROX_API_TOKEN:-}" ]; then
   export ROX_CENTRAL_ADDRESS ROX_API_TOKEN
@@ -41,6 +41,8 @@ export_bashrc_vars() {
   [ ! -f ~/.bashrc ] && return 0
   local var line
   for var in ROX_CENTRAL_ADDRESS ROX_API_TOKEN ROXCTL_CENTRAL_ENDPOINT API_TOKEN RHACS_NAMESPACE; do
+    # An exported value takes precedence over the ~/.bashrc line
+    [ -n "${!var:-}" ] && continue
     line=$(grep -E "^(export[[:space:]]+)?${var}=" ~/.bashrc 2>/dev/null | head -1) || true
     [ -z "${line}" ] && continue
     if grep -qE '\$\(|`' <<< "${line}"; then
@@ -14,6 +14,10 @@
 #   VERIFY_SKIP_PIPELINES=1 ./verify-all-setup.sh
 #   SKIP_OPENSHIFT_PIPELINES_SETUP=1 ./verify-all-setup.sh
 #
+# Sections are independent read-only checks and run concurrently; output is still printed in
+# section order once each finishes. Run them one at a time instead with:
+#   VERIFY_PARALLEL=0 ./verify-all-setup.sh
+#
 # Exit: 0 = no failures (warnings allowed); 1 = one or more checks failed.
 # --- end help ---
 
@@ -54,6 +58,13 @@ FAIL_FAM=0
 FAIL_MONITORING=0
 FAIL_MCP=0
 FAIL_PIPELINES=0
+# Resolved once in main() so each section reuses it instead of re-querying the route
+CENTRAL_URL=""
+
+VERIFY_PARALLEL="${VERIFY_PARALLEL:-1}"
+VERIFY_SECTIONS=(basic fam monitoring mcp pipelines hummingbird)
+VERIFY_TMP=""
+declare -A SECTION_PIDS=()
 
 usage() {
     sed -n '2,/^# --- end help ---$/p' "$0" | sed 's/^# \{0,1\}//' | sed '/^--- end help ---$/d'
@@ -88,6 +99,33 @@ get_central_url() {
     oc get route central -n "${RHACS_NAMESPACE}" -o jsonpath='https://{.spec.host}' 2>/dev/null || echo ""
 }
 
+# Fetch every RHACS API response the sections need with a single curl invocation: curl reuses
+# one TLS connection to Central across the URLs instead of one handshake per section.
+# --compressed: the full policy list is large, repetitive JSON and Central serves it gzip'd.
+prefetch_rox_api() {
+    if [ -z "${ROX_API_TOKEN:-}" ] || [ -z "${CENTRAL_URL}" ]; then
+        return 0
+    fi
+    curl -k -s --compressed -H "Authorization: Bearer ${ROX_API_TOKEN}" \
+        -o "${VERIFY_TMP}/api-policies.json" "${CENTRAL_URL}/v1/policies" \
+        -o "${VERIFY_TMP}/api-authProviders.json" "${CENTRAL_URL}/v1/authProviders" \
+        -o "${VERIFY_TMP}/api-baseimages.json" "${CENTRAL_URL}/v2/baseimages" \
+        2>/dev/null || true
+}
+
+# $1 section key — true for sections that read prefetch_rox_api results
+section_uses_api() {
+    case "$1" in
+        fam|monitoring|hummingbird) return 0 ;;
+    esac
+    return 1
+}
+
+# $1 response name (policies, authProviders, baseimages) — body fetched by prefetch_rox_api, or empty
+rox_api_cached() {
+    cat "${VERIFY_TMP}/api-$1.json" 2>/dev/null || echo ""
+}
+
 verify_basic() {
     print_step "basic-setup"
     local failed=0
@@ -98,10 +136,18 @@ verify_basic() {
     fi
     print_ok "Deployment central exists"
 
-    local ready desired
-    ready=$(oc get deployment central -n "${RHACS_NAMESPACE}" -o jsonpath='{.status.readyReplicas}' 2>/dev/null || echo "0")
-    desired=$(oc get deployment central -n "${RHACS_NAMESPACE}" -o jsonpath='{.spec.replicas}' 2>/dev/null || echo "1")
-    if [ "${ready:-0}" -ge 1 ] 2>/dev/null; then
+    # One read of the central Deployment for replica status and the script 08 feature flags
+    local ready desired init_support filters_ui
+    local central_env='{.spec.template.spec.containers[0].env'
+    local central_fields_jsonpath="{.status.readyReplicas}|{.spec.replicas}"
+    central_fields_jsonpath+="|${central_env}[?(@.name==\"ROX_INIT_CONTAINER_SUPPORT\")].value}"
+    central_fields_jsonpath+="|${central_env}[?(@.name==\"ROX_POLICY_FILTERS_UI\")].value}"
+    IFS='|' read -r ready desired init_support filters_ui < <(oc get deployment central -n "${RHACS_NAMESPACE}" \
+        -o jsonpath="${central_fields_jsonpath}" \
+        2>/dev/null || echo "0|1||") || true
+    ready="${ready:-0}"
+    desired="${desired:-1}"
+    if [ "${ready}" -ge 1 ] 2>/dev/null; then
         print_ok "Central readyReplicas=${ready} (desired ${desired})"
     else
         print_fail "Central not ready (readyReplicas=${ready}, desired ${desired})"
@@ -124,13 +170,9 @@ verify_basic() {
 
     if oc get ds collector -n "${RHACS_NAMESPACE}" &>/dev/null; then
         local collector_networks
-        collector_networks=$(oc get ds collector -n "${RHACS_NAMESPACE}" -o json 2>/dev/null | jq -r '
-            .spec.template.spec.containers[]
-            | select(.name == "collector")
-            | .env[]?
-            | select(.name == "ROX_NON_AGGREGATED_NETWORKS")
-            | .value
-        ' 2>/dev/null | head -1 || echo "")
+        collector_networks=$(oc get ds collector -n "${RHACS_NAMESPACE}" \
+            -o jsonpath='{.spec.template.spec.containers[?(@.name=="collector")].env[?(@.name=="ROX_NON_AGGREGATED_NETWORKS")].value}' \
+            2>/dev/null || echo "")
         if [ -n "${collector_networks}" ]; then
             print_ok "Collector ROX_NON_AGGREGATED_NETWORKS=${collector_networks}"
         else
@@ -150,11 +192,6 @@ verify_basic() {
         fi
     fi
 
-    local init_support filters_ui
-    init_support=$(oc get deployment central -n "${RHACS_NAMESPACE}" -o json 2>/dev/null | \
-        jq -r '.spec.template.spec.containers[0].env[]? | select(.name == "ROX_INIT_CONTAINER_SUPPORT") | .value' 2>/dev/null | head -1 || echo "")
-    filters_ui=$(oc get deployment central -n "${RHACS_NAMESPACE}" -o json 2>/dev/null | \
-        jq -r '.spec.template.spec.containers[0].env[]? | select(.name == "ROX_POLICY_FILTERS_UI") | .value' 2>/dev/null | head -1 || echo "")
     if [ "${init_support}" = "true" ]; then
         print_ok "Central ROX_INIT_CONTAINER_SUPPORT=true"
     else
@@ -203,11 +240,10 @@ verify_hummingbird() {
     done
 
     if [ -n "${ROX_API_TOKEN:-}" ]; then
-        local base api_v2 hi_base
-        base=$(get_central_url)
+        local base hi_base
+        base="${CENTRAL_URL}"
         if [ -n "${base}" ]; then
-            api_v2="${base}/v2"
-            hi_base=$(curl -k -s -H "Authorization: Bearer ${ROX_API_TOKEN}" "${api_v2}/baseimages" 2>/dev/null)
+            hi_base=$(rox_api_cached baseimages)
             if echo "${hi_base}" | jq -e '.baseImageReferences[]? | select(.baseImageRepoPath | test("hi/python"))' >/dev/null 2>&1; then
                 print_ok "Hummingbird base image registered in RHACS"
             else
@@ -253,7 +289,7 @@ verify_fam() {
     fi
 
     local base
-    base=$(get_central_url)
+    base="${CENTRAL_URL}"
     if [ -z "${base}" ]; then
         print_warn "Could not determine Central URL — skipping policy API check"
         WARNINGS=$((WARNINGS + 1))
@@ -261,7 +297,7 @@ verify_fam() {
     fi
 
     local policies_json
-    policies_json=$(curl -k -s -H "Authorization: Bearer ${ROX_API_TOKEN}" "${base}/v1/policies" 2>/dev/null || echo "")
+    policies_json=$(rox_api_cached policies)
     if ! echo "${policies_json}" | jq -e '.policies' &>/dev/null; then
         print_fail "Could not list policies from RHACS API"
         return 1
@@ -327,9 +363,9 @@ verify_monitoring() {
 
     if [ -n "${ROX_API_TOKEN:-}" ]; then
         local base providers
-        base=$(get_central_url)
+        base="${CENTRAL_URL}"
         if [ -n "${base}" ]; then
-            providers=$(curl -k -s -H "Authorization: Bearer ${ROX_API_TOKEN}" "${base}/v1/authProviders" 2>/dev/null || echo "")
+            providers=$(rox_api_cached authProviders)
             if echo "${providers}" | jq -e '.authProviders[] | select(.name=="Monitoring")' &>/dev/null; then
                 print_ok "RHACS auth provider 'Monitoring' exists"
             else
@@ -426,6 +462,86 @@ verify_openshift_pipelines() {
     return "${failed}"
 }
 
+# Per-section entry points: honor the skip flags, then run the checks
+section_basic() {
+    if skip_section "basic-setup" "VERIFY_SKIP_BASIC" "SKIP_BASIC_SETUP"; then
+        return 0
+    fi
+    verify_basic
+}
+
+section_fam() {
+    if skip_section "fam-setup" "VERIFY_SKIP_FAM" "SKIP_FAM_SETUP" "VERIFY_SKIP_FIM" "SKIP_FIM_SETUP"; then
+        return 0
+    fi
+    verify_fam
+}
+
+section_monitoring() {
+    if skip_section "monitoring-setup" "VERIFY_SKIP_MONITORING" "SKIP_MONITORING_SETUP"; then
+        return 0
+    fi
+    verify_monitoring
+}
+
+section_mcp() {
+    if skip_section "mcp-server-setup" "VERIFY_SKIP_MCP" "SKIP_MCP_SETUP"; then
+        return 0
+    fi
+    verify_mcp
+}
+
+section_pipelines() {
+    if skip_section "openshift-pipelines-setup" "VERIFY_SKIP_PIPELINES" "SKIP_OPENSHIFT_PIPELINES_SETUP"; then
+        return 0
+    fi
+    verify_openshift_pipelines
+}
+
+section_hummingbird() {
+    if skip_section "hummingbird-demo" "VERIFY_SKIP_HUMMINGBIRD" "SKIP_HUMMINGBIRD_DEMO"; then
+        return 0
+    fi
+    verify_hummingbird
+}
+
+# $1 section key — run section_<key> in the background, capturing its output and warning count
+start_section() {
+    local key="$1"
+    (
+        WARNINGS=0
+        ec=0
+        "section_${key}" || ec=$?
+        echo "${WARNINGS}" > "${VERIFY_TMP}/${key}.warnings"
+        exit "${ec}"
+    ) > "${VERIFY_TMP}/${key}.log" 2>&1 &
+    SECTION_PIDS["${key}"]=$!
+}
+
+# $1 section key — wait for a started section, replay its output and fold in its warnings
+finish_section() {
+    local key="$1"
+    local ec=0
+    wait "${SECTION_PIDS[${key}]}" || ec=$?
+    cat "${VERIFY_TMP}/${key}.log"
+    local w
+    w=$(cat "${VERIFY_TMP}/${key}.warnings" 2>/dev/null || echo 0)
+    WARNINGS=$((WARNINGS + ${w:-0}))
+    return "${ec}"
+}
+
+# $1 section key
+mark_section_failed() {
+    FAILURES=$((FAILURES + 1))
+    case "$1" in
+        basic) FAIL_BASIC=1 ;;
+        fam) FAIL_FAM=1 ;;
+        monitoring) FAIL_MONITORING=1 ;;
+        mcp) FAIL_MCP=1 ;;
+        pipelines) FAIL_PIPELINES=1 ;;
+    esac
+}
+
 main() {
     if [ "${1:-}" = "-h" ] || [ "${1:-}" = "--help" ]; then
         usage
@@ -452,65 +568,41 @@ main() {
         exit 1
     fi
 
-    if skip_section "basic-setup" "VERIFY_SKIP_BASIC" "SKIP_BASIC_SETUP"; then
-        :
-    else
-        verify_basic || {
-            FAILURES=$((FAILURES + 1))
-            FAIL_BASIC=1
-        }
-    fi
-    echo ""
+    CENTRAL_URL=$(get_central_url)
 
-    if skip_section "fam-setup" "VERIFY_SKIP_FAM" "SKIP_FAM_SETUP" "VERIFY_SKIP_FIM" "SKIP_FIM_SETUP"; then
-        :
-    else
-        verify_fam || {
-            FAILURES=$((FAILURES + 1))
-            FAIL_FAM=1
-        }
-    fi
-    echo ""
+    VERIFY_TMP=$(mktemp -d)
+    trap 'rm -rf "${VERIFY_TMP}"' EXIT
 
-    if skip_section "monitoring-setup" "VERIFY_SKIP_MONITORING" "SKIP_MONITORING_SETUP"; then
-        :
-    else
-        verify_monitoring || {
-            FAILURES=$((FAILURES + 1))
-            FAIL_MONITORING=1
-        }
-    fi
-    echo ""
+    # Prefetch API responses in the background while oc-only sections run; wait before any
+    # section that reads them.
+    prefetch_rox_api &
+    local prefetch_pid=$!
 
-    if skip_section "mcp-server-setup" "VERIFY_SKIP_MCP" "SKIP_MCP_SETUP"; then
-        :
-    else
-        verify_mcp || {
-            FAILURES=$((FAILURES + 1))
-            FAIL_MCP=1
-        }
+    local key
+    if [ "${VERIFY_PARALLEL}" = "1" ]; then
+        for key in "${VERIFY_SECTIONS[@]}"; do
+            section_uses_api "${key}" || start_section "${key}"
+        done
+        wait "${prefetch_pid}" 2>/dev/null || true
+        for key in "${VERIFY_SECTIONS[@]}"; do
+            if section_uses_api "${key}"; then
+                start_section "${key}"
+            fi
+        done
     fi
-    echo ""
 
-    if skip_section "openshift-pipelines-setup" "VERIFY_SKIP_PIPELINES" "SKIP_OPENSHIFT_PIPELINES_SETUP"; then
-        :
-    else
-        verify_openshift_pipelines || {
-            FAILURES=$((FAILURES + 1))
-            FAIL_PIPELINES=1
-        }
-    fi
-    echo ""
-
-    if skip_section "hummingbird-demo" "VERIFY_SKIP_HUMMINGBIRD" "SKIP_HUMMINGBIRD_DEMO"; then
-        :
-    else
-        verify_hummingbird || {
-            FAILURES=$((FAILURES + 1))
-        }
-    fi
+    for key in "${VERIFY_SECTIONS[@]}"; do
+        if [ "${VERIFY_PARALLEL}" = "1" ]; then
+            finish_section "${key}" || mark_section_failed "${key}"
+        else
+            if section_uses_api "${key}"; then
+                wait "${prefetch_pid}" 2>/dev/null || true
+            fi
+            "section_${key}" || mark_section_failed "${key}"
+        fi
+        echo ""
+    done
 
-    echo ""
     print_step "Summary"
     if [ "${FAILURES}" -eq 0 ]; then
         print_ok "No failed checks (${WARNINGS} warning(s))"